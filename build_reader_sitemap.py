@@ -1,9 +1,20 @@
 import json
-import gzip
+import io
 from pathlib import Path
 from datetime import datetime, timezone
 from urllib.parse import quote
 
+try:
+    # ISA-L SIMD deflate, drop-in for the stdlib gzip module
+    from isal import igzip as gzip_mod
+except ImportError:
+    import gzip as gzip_mod
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # stdlib json fallback
+
 SITE = "https://hornupdates.com"
 ARTICLES_JSON = Path("articles.json")          # adjust if needed
 SITEMAP_XML = Path("sitemap-reader.xml")       # output
@@ -11,6 +22,12 @@ SITEMAP_GZ = Path("sitemap-reader.xml.gz")     # optional compressed output
 
 MAX_URLS = 50000  # Google limit per sitemap
 
+# Level 6 is the balanced tier: within a few % of level 9 on repetitive XML
+# for a fraction of the CPU. ISA-L only has levels 0-3; 2 is its balanced one.
+# Large buffers batch the many small line writes into few deflate calls.
+GZIP_LEVEL = 2 if gzip_mod.__name__ == "isal.igzip" else 6
+WRITE_BUFFER = 256 * 1024
+
 def iso_date(dt_str: str | None) -> str | None:
     """Return YYYY-MM-DD from ISO-ish string, or None."""
     if not dt_str:
@@ -24,7 +41,10 @@ def iso_date(dt_str: str | None) -> str | None:
         return None
 
 def load_articles() -> list[dict]:
-    data = json.loads(ARTICLES_JSON.read_text(encoding="utf-8"))
+    if orjson:
+        data = orjson.loads(ARTICLES_JSON.read_bytes())
+    else:
+        data = json.loads(ARTICLES_JSON.read_text(encoding="utf-8"))
     if isinstance(data, list):
         return data
     return data.get("articles", []) or []
@@ -38,10 +58,9 @@ def main():
     if not ARTICLES_JSON.exists():
         raise FileNotFoundError(f"Missing {ARTICLES_JSON.resolve()}")
 
-    articles = load_articles()
     urls = []
 
-    for a in articles:
+    for a in load_articles():
         src = a.get("source_url") or a.get("link")
         if not src:
             continue
@@ -55,25 +74,26 @@ def main():
 
     now = datetime.now(timezone.utc).date().isoformat()
 
-    # Build XML
-    lines = []
-    lines.append('<?xml version="1.0" encoding="UTF-8"?>')
-    lines.append('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
-
-    for loc, lastmod in urls:
-        lines.append("  <url>")
-        lines.append(f"    <loc>{loc}</loc>")
-        lines.append(f"    <lastmod>{lastmod or now}</lastmod>")
-        lines.append("  </url>")
-
-    lines.append("</urlset>")
-    xml = "\n".join(lines) + "\n"
-
-    SITEMAP_XML.write_text(xml, encoding="utf-8")
-
-    # Optional: gzip it too (Google accepts .gz)
-    with gzip.open(SITEMAP_GZ, "wb") as f:
-        f.write(xml.encode("utf-8"))
+    # Stream XML into the plain file and the .gz (Google accepts .gz) at once,
+    # so the whole document is never held in memory
+    with SITEMAP_XML.open("wb", buffering=WRITE_BUFFER) as raw, \
+            gzip_mod.open(SITEMAP_GZ, "wb", compresslevel=GZIP_LEVEL) as gz_file, \
+            io.BufferedWriter(gz_file, buffer_size=WRITE_BUFFER) as gz:
+        def emit(line: str) -> None:
+            b = (line + "\n").encode("utf-8")
+            raw.write(b)
+            gz.write(b)
+
+        emit('<?xml version="1.0" encoding="UTF-8"?>')
+        emit('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
+
+        for loc, lastmod in urls:
+            emit("  <url>")
+            emit(f"    <loc>{loc}</loc>")
+            emit(f"    <lastmod>{lastmod or now}</lastmod>")
+            emit("  </url>")
+
+        emit("</urlset>")
 
     print(f"[OK] Wrote {SITEMAP_XML} ({len(urls)} URLs)")
     print(f"[OK] Wrote {SITEMAP_GZ} (compressed)")
@@ -1,22 +1,37 @@
 import json, re, hashlib, html
-from urllib.parse import urlparse
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # stdlib json fallback
+
+_SCRIPT_RE = re.compile(r"<(script|style)[^>]*>.*?</\1>", re.I | re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_IMG_RE = re.compile(r'<img[^>]+src="([^"]+)"', re.I)
+_AR_RE = re.compile(r"[\u0600-\u06FF]")
+_LEAD_DASH_RE = re.compile(r"^\-\s*")
 
 def strip_html(s: str) -> str:
     if not s:
         return ""
-    s = html.unescape(s)
+    if "<" not in s and "&" not in s:
+        return _WS_RE.sub(" ", s).strip()  # plain text: nothing to parse or decode
+    if "&" in s:  # no entities to decode in most stored text
+        s = html.unescape(s)
     # remove scripts/styles
-    s = re.sub(r"<(script|style)[^>]*>.*?</\1>", "", s, flags=re.I|re.S)
+    s = _SCRIPT_RE.sub("", s)
     # remove all tags
-    s = re.sub(r"<[^>]+>", " ", s)
+    s = _TAG_RE.sub(" ", s)
     # collapse whitespace
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WS_RE.sub(" ", s).strip()
     return s
 
 def extract_first_img(s: str) -> str:
     if not s:
         return ""
-    m = re.search(r'<img[^>]+src="([^"]+)"', s, flags=re.I)
+    m = _IMG_RE.search(s)
     return m.group(1).strip() if m else ""
 
 def normalize_source_name(name: str) -> str:
@@ -24,20 +39,25 @@ def normalize_source_name(name: str) -> str:
         return ""
     name = name.strip()
     # remove leading "- " like "- The EastAfrican"
-    name = re.sub(r"^\-\s*", "", name)
-    return re.sub(r"\s+", " ", name).strip()
+    name = _LEAD_DASH_RE.sub("", name)
+    return _WS_RE.sub(" ", name).strip()
 
 def detect_lang(text: str) -> str:
     # simple heuristic: Arabic unicode block
-    if re.search(r"[\u0600-\u06FF]", text or ""):
+    if _AR_RE.search(text or ""):
         return "ar"
     return "en"
 
 def make_id(url: str) -> str:
-    return hashlib.sha1((url or "").encode("utf-8")).hexdigest()[:12]
+    # 48-bit non-cryptographic id; blake2b is cheaper than sha1 per byte
+    return hashlib.blake2b((url or "").encode("utf-8"), digest_size=6).hexdigest()
+
+ARTICLES_JSON = Path("articles.json")
 
-with open("articles.json", "r", encoding="utf-8") as f:
-    data = json.load(f)
+if orjson:
+    data = orjson.loads(ARTICLES_JSON.read_bytes())
+else:
+    data = json.loads(ARTICLES_JSON.read_text(encoding="utf-8"))
 
 articles = data.get("articles", [])
 cleaned = []
@@ -74,7 +94,9 @@ for a in articles:
 
 data["articles"] = cleaned
 
-with open("articles.json", "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+if orjson:
+    ARTICLES_JSON.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+else:
+    ARTICLES_JSON.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
 
 print(f"✅ Cleaned {len(cleaned)} articles -> articles.json")
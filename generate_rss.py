@@ -1,13 +1,22 @@
+import heapq
 import json
 from datetime import datetime, timezone
+from operator import itemgetter
 from email.utils import format_datetime
 from pathlib import Path
 import html
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # stdlib json fallback
+
 SITE_TITLE = "Horn Updates"
 SITE_LINK = "https://hornupdates.com"
 SITE_DESC = "News from the Horn of Africa — AI summaries with links to original publishers."
 OUT_FILE = "rss.xml"
+ARTICLES_JSON = Path("articles.json")
+MAX_ITEMS = 50
 
 def parse_dt(s):
     if not s:
@@ -27,16 +36,17 @@ def rfc822(dt):
         dt = dt.replace(tzinfo=timezone.utc)
     return format_datetime(dt.astimezone(timezone.utc))
 
+def load_articles():
+    p = ARTICLES_JSON
+    data = orjson.loads(p.read_bytes()) if orjson else json.loads(p.read_text(encoding="utf-8"))
+    return data if isinstance(data, list) else data.get("articles", [])
+
 def main():
-    p = Path("articles.json")
-    if not p.exists():
+    if not ARTICLES_JSON.exists():
         raise FileNotFoundError("articles.json not found in current folder")
 
-    data = json.loads(p.read_text(encoding="utf-8"))
-    items = data if isinstance(data, list) else data.get("articles", [])
-
     # keep valid stories
-    items = [a for a in items if a.get("title") and (a.get("source_url") or a.get("link"))]
+    items = (a for a in load_articles() if a.get("title") and (a.get("source_url") or a.get("link")))
 
     def item_dt(a):
         return (
@@ -45,10 +55,25 @@ def main():
             or datetime(1970, 1, 1, tzinfo=timezone.utc)
         )
 
-    items.sort(key=item_dt, reverse=True)
+    # bounded heap: only the newest MAX_ITEMS are ever held, no full sort.
+    # Each date is parsed once and carried alongside its article.
+    dated = ((item_dt(a), a) for a in items)
+    top = heapq.nlargest(MAX_ITEMS, dated, key=itemgetter(0))
 
-    rss_items = []
-    for a in items[:50]:
+    # Encode straight into one buffer instead of building item strings and joining
+    buf = bytearray()
+    w = buf.extend
+    now = rfc822(datetime.now(timezone.utc))
+    w(f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>{html.escape(SITE_TITLE)}</title>
+    <link>{html.escape(SITE_LINK)}</link>
+    <description>{html.escape(SITE_DESC)}</description>
+    <lastBuildDate>{now}</lastBuildDate>
+""".encode("utf-8"))
+
+    for pub, a in top:
         title = html.escape(str(a.get("title", "")).strip())
         source_url = str(a.get("source_url") or a.get("link") or "").strip()
         link = html.escape(source_url)
@@ -58,34 +83,26 @@ def main():
         summary_raw = a.get("summary") or a.get("excerpt") or ""
         summary = html.escape(str(summary_raw).strip())
 
-        pub = item_dt(a)
         pubdate = rfc822(pub)
 
-        rss_items.append(f"""\
+        w(f"""\
     <item>
       <title>{title}</title>
       <link>{link}</link>
       <guid isPermaLink="true">{guid}</guid>
       <pubDate>{pubdate}</pubDate>
       <description><![CDATA[{summary}]]></description>
-    </item>""")
-
-    now = rfc822(datetime.now(timezone.utc))
+    </item>
+""".encode("utf-8"))
 
-    rss = f"""<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0">
-  <channel>
-    <title>{html.escape(SITE_TITLE)}</title>
-    <link>{html.escape(SITE_LINK)}</link>
-    <description>{html.escape(SITE_DESC)}</description>
-    <lastBuildDate>{now}</lastBuildDate>
-{chr(10).join(rss_items)}
-  </channel>
+    if not top:
+        w(b"\n")
+    w(b"""  </channel>
 </rss>
-"""
+""")
 
-    Path(OUT_FILE).write_text(rss, encoding="utf-8")
-    print(f"[OK] Wrote {OUT_FILE} with {min(len(items), 50)} items")
+    Path(OUT_FILE).write_bytes(buf)
+    print(f"[OK] Wrote {OUT_FILE} with {len(top)} items")
 
 if __name__ == "__main__":
     main()
@@ -10,7 +10,11 @@ import json
 import re
 import html as _html
 import hashlib
+import heapq
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
@@ -22,6 +26,21 @@ try:
 except ImportError:
     raise SystemExit("feedparser is required: pip install feedparser")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # falls back to stdlib json
+
+try:
+    import requests
+except ImportError:
+    requests = None  # feedparser fetches the URL itself
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # falls back to per-keyword scans
+
 try:
     import openai as _openai
     _OPENAI_AVAILABLE = True
@@ -31,11 +50,15 @@ except ImportError:
 # ── Config ─────────────────────────────────────────────────────────────────────
 
 OUTPUT_PATH = Path(__file__).resolve().parent / "articles.json"
+FEED_CACHE_PATH = OUTPUT_PATH.parent / "feed_cache.json"  # per-feed ETag / Last-Modified
 PER_SOURCE_CAP = 25        # max articles kept per source in the final output
 TOTAL_CAP = 350            # max total articles before pruning oldest
 MAX_AGE_DAYS = 45          # discard articles older than this
 SUMMARY_MAX = 600          # truncate summaries to this many characters
 ENTRIES_PER_FEED = 30      # how many entries to read from each feed
+FETCH_WORKERS = 8          # feeds downloaded concurrently
+FETCH_TIMEOUT = (5, 20)    # seconds per feed request: (connect, read)
+USER_AGENT = "HornUpdatesBot/1.0 (+https://hornupdates.com)"
 
 # ── AI Context Generation ───────────────────────────────────────────────────────
 
@@ -290,29 +313,79 @@ TOPIC_KEYWORDS: Dict[str, List[str]] = {
     ],
 }
 
+# ── Title quality filter ───────────────────────────────────────────────────────
+# Lifestyle, entertainment and clickbait titles containing any of these are dropped
+
+SKIP_TITLE_KEYWORDS: tuple = (
+    "horoscope", "recipe", "zodiac", "celebrity", "gossip",
+    "beauty tip", "fashion", "lifestyle", "relationship advice",
+    "quiz:", "poll:", "i have news for you", "here's to hoping",
+    "success lies in human connection",
+)
+
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
+def _json_loads(path: Path) -> Any:
+    if orjson:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize compactly (2-space indent if pretty); orjson and stdlib output match."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _write_json_atomic(path: Path, obj: Any, pretty: bool = True) -> None:
+    """Write via a temp file + os.replace so an interrupted run never leaves half a file.
+
+    Without orjson, json.dump streams into the file instead of building the whole
+    document as one string first.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    if orjson:
+        tmp.write_bytes(_json_dumps(obj, pretty))
+    else:
+        with tmp.open("w", encoding="utf-8", newline="\n") as fp:
+            if pretty:
+                json.dump(obj, fp, indent=2, ensure_ascii=False)
+            else:
+                json.dump(obj, fp, separators=(",", ":"), ensure_ascii=False)
+    os.replace(tmp, path)
+
+
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
 _WS_RE = re.compile(r"\s+")
 _URL_RE = re.compile(r"https?://\S+")
+_ARABIC_RE = re.compile(r"[\u0600-\u06FF]")
+_NON_WORD_RE = re.compile(r"\W+")
 
 
 def clean_text(s: str) -> str:
-    s = _html.unescape(s or "")
-    s = _HTML_TAG_RE.sub(" ", s)
+    s = s or ""
+    if "<" in s or "&" in s:  # plain text skips straight to the URL/whitespace passes
+        if "&" in s:  # most feed text carries no entities; skip the copy
+            s = _html.unescape(s)
+        s = _HTML_TAG_RE.sub(" ", s)
     s = _URL_RE.sub("", s)
     s = _WS_RE.sub(" ", s).strip()
     return s
 
 
 def detect_lang(text: str) -> str:
-    if re.search(r"[\u0600-\u06FF]", text or ""):
+    if _ARABIC_RE.search(text or ""):
         return "ar"
     return "en"
 
 
-def tag_countries(text: str, default: List[str]) -> List[str]:
-    lc = text.lower()
+def tag_countries(text: str, default: List[str], lc: Optional[str] = None) -> List[str]:
+    if lc is None:
+        lc = text.lower()
     found = [c for c, kws in COUNTRY_KEYWORDS.items() if any(kw in lc for kw in kws)]
     if found:
         # Only use keyword-detected countries; don't blindly inherit source country
@@ -321,13 +394,81 @@ def tag_countries(text: str, default: List[str]) -> List[str]:
     return default if default else []
 
 
+@lru_cache(maxsize=None)
+def _phrase_re(phrase: str) -> "re.Pattern[str]":
+    return re.compile(r"(?<![a-z])" + re.escape(phrase) + r"(?![a-z])")
+
+
 def _word_match(text: str, phrase: str) -> bool:
-    return bool(re.search(r"(?<![a-z])" + re.escape(phrase) + r"(?![a-z])", text))
+    return bool(_phrase_re(phrase).search(text))
+
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Single-word topic keywords are matched by set intersection against the text's
+# tokens (equivalent to _word_match for pure a-z words); phrases and keywords
+# with punctuation/spaces still go through _word_match.
+_TOPIC_WORDS: Dict[str, frozenset] = {
+    t: frozenset(kw for kw in kws if _WORD_RE.fullmatch(kw)) for t, kws in TOPIC_KEYWORDS.items()
+}
+_TOPIC_PHRASES: Dict[str, List[str]] = {
+    t: [kw for kw in kws if not _WORD_RE.fullmatch(kw)] for t, kws in TOPIC_KEYWORDS.items()
+}
+
+
+def tag_topics(text: str, lc: Optional[str] = None) -> List[str]:
+    if lc is None:
+        lc = text.lower()
+    tokens = set(_WORD_RE.findall(lc))
+    return [
+        t for t in TOPIC_KEYWORDS
+        if not tokens.isdisjoint(_TOPIC_WORDS[t]) or any(_word_match(lc, kw) for kw in _TOPIC_PHRASES[t])
+    ] or ["General"]
+
+
+def _build_keyword_automaton():
+    """One Aho–Corasick automaton over every country and topic keyword."""
+    if not ahocorasick:
+        return None
+    labels: Dict[str, List[tuple]] = {}
+    for kind, table in (("country", COUNTRY_KEYWORDS), ("topic", TOPIC_KEYWORDS)):
+        for label, kws in table.items():
+            for kw in kws:
+                labels.setdefault(kw, []).append((kind, label))
+    automaton = ahocorasick.Automaton()
+    for kw, kw_labels in labels.items():
+        automaton.add_word(kw, (len(kw), kw_labels))
+    automaton.make_automaton()
+    return automaton
+
 
+_KEYWORD_AC = _build_keyword_automaton()
 
-def tag_topics(text: str) -> List[str]:
+
+def _is_letter(lc: str, i: int) -> bool:
+    return 0 <= i < len(lc) and "a" <= lc[i] <= "z"
+
+
+def classify(text: str, default_countries: List[str]) -> tuple:
+    """Return (country_tags, topic_tags) — same result as tag_countries + tag_topics, in one pass."""
     lc = text.lower()
-    return [t for t, kws in TOPIC_KEYWORDS.items() if any(_word_match(lc, kw) for kw in kws)] or ["General"]
+    if _KEYWORD_AC is None:
+        return tag_countries(text, default_countries, lc), tag_topics(text, lc)
+    countries: set = set()
+    topics: set = set()
+    for end, (length, kw_labels) in _KEYWORD_AC.iter(lc):
+        start = end - length + 1
+        for kind, label in kw_labels:
+            if kind == "country":
+                countries.add(label)
+            elif not _is_letter(lc, start - 1) and not _is_letter(lc, end + 1):
+                # topic keywords must match on word boundaries (see _word_match)
+                topics.add(label)
+    found = [c for c in COUNTRY_KEYWORDS if c in countries]
+    return (
+        found or (default_countries if default_countries else []),
+        [t for t in TOPIC_KEYWORDS if t in topics] or ["General"],
+    )
 
 
 def make_id(url: str) -> str:
@@ -349,7 +490,9 @@ def parse_dt(entry) -> Optional[datetime]:
                 s = str(s).strip()
                 if s.endswith("Z"):
                     s = s[:-1] + "+00:00"
-                return datetime.fromisoformat(s)
+                d = datetime.fromisoformat(s)
+                # always aware, so callers can compare against the UTC cutoff
+                return d if d.tzinfo else d.replace(tzinfo=timezone.utc)
             except Exception:
                 pass
     return None
@@ -368,26 +511,101 @@ def get_summary(entry) -> str:
 
 # ── Core fetch ─────────────────────────────────────────────────────────────────
 
-def fetch_feed(feed_def: Dict[str, Any]) -> List[Dict[str, Any]]:
+_HTTP = None
+if requests is not None:
+    # One pooled session: keep-alive across feeds, gzip/deflate on the wire
+    _HTTP = requests.Session()
+    _HTTP.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"})
+
+
+def load_feed_cache() -> Dict[str, Dict[str, str]]:
+    if not FEED_CACHE_PATH.exists():
+        return {}
+    try:
+        return _json_loads(FEED_CACHE_PATH)
+    except Exception:
+        return {}
+
+
+def save_feed_cache(cache: Dict[str, Dict[str, str]]) -> None:
+    _write_json_atomic(FEED_CACHE_PATH, cache)
+
+
+def download_feed(feed_def: Dict[str, Any], cache: Optional[Dict[str, Dict[str, str]]] = None):
+    """Network half of fetch_feed — safe to run in a worker thread.
+
+    With a cache, sends the feed's stored ETag / Last-Modified as a conditional GET;
+    an unchanged feed comes back as a 304 with no entries. Returns (parsed feed,
+    new validators or None); the cache is only read here — main() stores the
+    validators once fetch_feed has processed the feed.
+    """
     url = feed_def["url"]
+    validators = (cache or {}).get(url, {})
+
+    if _HTTP is None:
+        d = feedparser.parse(
+            url, agent=USER_AGENT,
+            etag=validators.get("etag"), modified=validators.get("last_modified"),
+        )
+        etag, last_modified = d.get("etag"), d.get("modified")
+    else:
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        resp = _HTTP.get(url, headers=headers, timeout=FETCH_TIMEOUT)
+        if resp.status_code == 304:
+            return feedparser.FeedParserDict(status=304, entries=[], href=resp.url), None
+        d = feedparser.parse(resp.content, response_headers={
+            "content-type": resp.headers.get("Content-Type", ""),
+            "content-location": resp.url,
+        })
+        d["status"] = resp.status_code
+        d["href"] = resp.url
+        etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+
+    new_validators = None
+    if d.entries and (etag or last_modified):
+        new_validators = {k: v for k, v in (("etag", etag), ("last_modified", last_modified)) if v}
+    return d, new_validators
+
+
+def _url_key(url: str) -> str:
+    return (url or "").strip().rstrip("/")
+
+
+def fetch_feed(
+    feed_def: Dict[str, Any],
+    download: Optional[Future] = None,
+    seen_urls: Optional[set] = None,
+) -> List[Dict[str, Any]]:
+    """Parse one feed into article dicts. Links already in seen_urls (last run's output
+    plus earlier feeds this run) are skipped before tagging, and kept ones are added.
+    "context" is left as None here; main() fills it for the articles that survive dedupe/caps."""
     source_name = feed_def["source_name"]
     default_countries = feed_def.get("countries", [])
     default_lang = feed_def.get("lang", "en")
 
     print(f"  Fetching {source_name} …", end=" ", flush=True)
     try:
-        d = feedparser.parse(url)
+        d, _ = download.result() if download is not None else download_feed(feed_def)
     except Exception as e:
         print(f"ERROR: {e}")
         return []
 
+    if getattr(d, "status", None) == 304:
+        print("not modified since last run")
+        return []
+
     entries = getattr(d, "entries", [])
     if not entries:
         status = getattr(d, "status", "?")
         print(f"no entries (HTTP {status})")
         return []
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=MAX_AGE_DAYS)
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=MAX_AGE_DAYS)
     results: List[Dict[str, Any]] = []
 
     horn_only = feed_def.get("horn_only", not default_countries)
@@ -397,15 +615,13 @@ def fetch_feed(feed_def: Dict[str, Any]) -> List[Dict[str, Any]]:
         link = (getattr(e, "link", None) or "").strip()
         if not title or not link:
             continue
+        url_key = _url_key(link)
+        if seen_urls is not None and url_key in seen_urls:
+            continue  # syndicated copy already taken from an earlier feed
 
         # Quality filter — skip lifestyle, entertainment, clickbait
-        _tl = title.lower()
-        if any(kw in _tl for kw in [
-            "horoscope", "recipe", "zodiac", "celebrity", "gossip",
-            "beauty tip", "fashion", "lifestyle", "relationship advice",
-            "quiz:", "poll:", "i have news for you", "here's to hoping",
-            "success lies in human connection",
-        ]):
+        tl = title.lower()
+        if any(kw in tl for kw in SKIP_TITLE_KEYWORDS):
             continue
 
         summary = get_summary(e)
@@ -415,16 +631,14 @@ def fetch_feed(feed_def: Dict[str, Any]) -> List[Dict[str, Any]]:
         if pub and pub < cutoff:
             continue
 
-        countries = tag_countries(combined, default_countries)
+        countries, topics = classify(combined, default_countries)
 
         # For regional feeds with no default country, skip if no Horn country detected
         if horn_only and not countries:
             continue
 
-        pub_iso = pub.isoformat() if pub else datetime.now(timezone.utc).isoformat()
+        pub_iso = (pub or now).isoformat()
         lang = detect_lang(combined) if default_lang == "en" else default_lang
-        topics = tag_topics(combined)
-        context = generate_article_context(title, summary[:SUMMARY_MAX], countries, topics)
 
         results.append({
             "title": title,
@@ -435,33 +649,60 @@ def fetch_feed(feed_def: Dict[str, Any]) -> List[Dict[str, Any]]:
             "published_at": pub_iso,
             "source_url": link,
             "source_name": source_name,
-            "context": context,
+            "context": None,
         })
+        if seen_urls is not None:
+            seen_urls.add(url_key)
 
     print(f"{len(results)} articles")
     return results
 
 
+# ── AI context ─────────────────────────────────────────────────────────────────
+
+def add_contexts(final: List[Dict[str, Any]], incoming: List[Dict[str, Any]]) -> None:
+    """Generate AI context for this run's new articles that made the final cut.
+
+    The OpenAI calls are network-bound, so they run on a thread pool rather than
+    one by one inside the feed loop.
+    """
+    fresh = {id(a) for a in incoming}
+    pending = [a for a in final if id(a) in fresh]
+    if not pending:
+        return
+
+    def _context(a: Dict[str, Any]) -> Optional[str]:
+        return generate_article_context(a["title"], a["summary"], a["country_tags"], a["topic_tags"])
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        for a, context in zip(pending, pool.map(_context, pending)):
+            a["context"] = context
+
+
 # ── Dedup + merge ──────────────────────────────────────────────────────────────
 
 def load_existing() -> List[Dict[str, Any]]:
     if not OUTPUT_PATH.exists():
         return []
     try:
-        data = json.loads(OUTPUT_PATH.read_text(encoding="utf-8"))
+        data = _json_loads(OUTPUT_PATH)
         return data if isinstance(data, list) else data.get("articles", [])
     except Exception:
         return []
 
 
+def _title_key(title: str) -> str:
+    return _NON_WORD_RE.sub(" ", title.lower()).strip()
+
+
 def dedupe(existing: List[Dict[str, Any]], incoming: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     seen_urls: set = set()
     seen_titles: set = set()
     merged: List[Dict[str, Any]] = []
 
     for a in incoming + existing:
-        url = (a.get("source_url") or a.get("link") or "").strip().rstrip("/")
-        title_key = re.sub(r"\W+", " ", (a.get("title") or "").lower()).strip()
+        url = _url_key(a.get("source_url") or a.get("link"))
+        title_key = _title_key(a.get("title") or "")
         if url in seen_urls or (title_key and title_key in seen_titles):
             continue
         if url:
@@ -473,21 +714,32 @@ def dedupe(existing: List[Dict[str, Any]], incoming: List[Dict[str, Any]]) -> Li
     return merged
 
 
-def apply_caps(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    def pub_dt(a):
-        s = a.get("published_at") or ""
-        try:
-            if s.endswith("Z"):
-                s = s[:-1] + "+00:00"
-            return datetime.fromisoformat(s)
-        except Exception:
-            return datetime.min.replace(tzinfo=timezone.utc)
+def _pub_dt(a: Dict[str, Any]) -> datetime:
+    s = a.get("published_at") or ""
+    try:
+        if s.endswith("Z"):
+            s = s[:-1] + "+00:00"
+        return datetime.fromisoformat(s)
+    except Exception:
+        return datetime.min.replace(tzinfo=timezone.utc)
 
-    articles.sort(key=pub_dt, reverse=True)
+
+def apply_caps(fresh: List[Dict[str, Any]], backlog: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Newest-first merge of this run's articles with the previous output, then the caps.
+
+    backlog comes from the articles.json this function wrote last run, so it is
+    already newest-first: only the few fresh articles are sorted, the two runs are
+    merged lazily, and the walk stops once TOTAL_CAP is reached. Ties keep fresh
+    articles first, exactly as a stable sort of fresh + backlog would.
+    """
+    fresh_keyed = sorted(((_pub_dt(a), a) for a in fresh), key=itemgetter(0), reverse=True)
+    backlog_keyed = [(_pub_dt(a), a) for a in backlog]
+    if any(x[0] < y[0] for x, y in zip(backlog_keyed, backlog_keyed[1:])):
+        backlog_keyed.sort(key=itemgetter(0), reverse=True)  # hand-edited file — sort it
 
     source_counts: Dict[str, int] = {}
     result: List[Dict[str, Any]] = []
-    for a in articles:
+    for _, a in heapq.merge(fresh_keyed, backlog_keyed, key=itemgetter(0), reverse=True):
         src = a.get("source_name", "Unknown")
         if source_counts.get(src, 0) >= PER_SOURCE_CAP:
             continue
@@ -499,8 +751,38 @@ def apply_caps(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return result
 
 
+def write_articles(final: List[Dict[str, Any]], existing: List[Dict[str, Any]]) -> None:
+    """Write articles.json only when the articles list itself changed.
+
+    existing is what load_existing() read at the start of the run (empty if the file
+    was missing or unreadable). Comparing canonical JSON avoids spurious commits caused
+    by the generated_at timestamp alone.
+    """
+    if OUTPUT_PATH.exists() and _json_dumps(final) == _json_dumps(existing):
+        print(f"\n✅ Articles unchanged — skipping write ({len(final)} articles)")
+    else:
+        payload = {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "articles": final,
+        }
+        _write_json_atomic(OUTPUT_PATH, payload)
+        print(f"\n✅ Wrote {len(final)} articles to {OUTPUT_PATH.name}")
+
+
 # ── Main ───────────────────────────────────────────────────────────────────────
 
+# Opinion-page metadata, read by update_homepage_deep_dive for every opinion-*.html
+_OP_TITLE_RE = re.compile(r"<title>([^<]+)</title>")
+_OP_TITLE_SUFFIX_RE = re.compile(r"\s*\|.*$")
+_OP_DESC_RE = re.compile(r'<meta name="description" content="([^"]+)"')
+_OP_DATE_RE = re.compile(r'"datePublished":\s*"([^"]+)"')
+_OP_BYLINE_DATE_RE = re.compile(r"(?:By [^\xb7]+\xb7\s*)([A-Z][a-z]+ \d{1,2},?\s*\d{4}|[A-Z][a-z]+ \d{4})")
+_OP_FILENAME_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})\.html$")
+_OP_PERSON_RE = re.compile(r'"@type":\s*"Person"[^}]{0,300}"name":\s*"([^"]+)"', re.DOTALL)
+_OP_PERSON_REV_RE = re.compile(r'"name":\s*"([^"]+)"[^}]{0,300}"@type":\s*"Person"', re.DOTALL)
+_OP_KEYWORDS_RE = re.compile(r'"keywords":\s*"([^"]+)"')
+_OP_WORDCOUNT_RE = re.compile(r"~([\d,]+) words")
+
 
 def update_homepage_deep_dive() -> None:
     """Rebuild the Deep Dive section in index.html with the 6 most recent opinion articles."""
@@ -520,18 +802,18 @@ def update_homepage_deep_dive() -> None:
         try:
             src = path.read_text(encoding="utf-8")
 
-            title_m = re.search(r"<title>([^<]+)</title>", src)
+            title_m = _OP_TITLE_RE.search(src)
             if not title_m:
                 continue
             title = title_m.group(1)
-            title = re.sub(r"\s*\|.*$", "", title).strip()
+            title = _OP_TITLE_SUFFIX_RE.sub("", title).strip()
 
-            desc_m = re.search(r'<meta name="description" content="([^"]+)"', src)
+            desc_m = _OP_DESC_RE.search(src)
             if not desc_m:
                 continue
             desc = desc_m.group(1).strip()
 
-            date_m = re.search(r'"datePublished":\s*"([^"]+)"', src)
+            date_m = _OP_DATE_RE.search(src)
             pub_date: Optional[datetime] = None
             if date_m:
                 try:
@@ -540,7 +822,7 @@ def update_homepage_deep_dive() -> None:
                     pass
             if not pub_date:
                 # Try byline: "By Author · April 20, 2026" or "By Author · April 2026"
-                bl_m = re.search(r"(?:By [^\xb7]+\xb7\s*)([A-Z][a-z]+ \d{1,2},?\s*\d{4}|[A-Z][a-z]+ \d{4})", src)
+                bl_m = _OP_BYLINE_DATE_RE.search(src)
                 if bl_m:
                     raw = bl_m.group(1).replace(",", "").strip()
                     for fmt in ("%B %d %Y", "%B %Y"):
@@ -551,7 +833,7 @@ def update_homepage_deep_dive() -> None:
                             pass
             if not pub_date:
                 # Try filename date: opinion-name-2026-04-21.html
-                fn_m = re.search(r"(\d{4})-(\d{2})-(\d{2})\.html$", path.name)
+                fn_m = _OP_FILENAME_DATE_RE.search(path.name)
                 if fn_m:
                     try:
                         pub_date = datetime(int(fn_m.group(1)), int(fn_m.group(2)), int(fn_m.group(3)), tzinfo=timezone.utc)
@@ -562,22 +844,14 @@ def update_homepage_deep_dive() -> None:
 
             # Author: find Person @type in JSON-LD
             author = "Horn Updates"
-            person_m = re.search(
-                r'"@type":\s*"Person"[^}]{0,300}"name":\s*"([^"]+)"',
-                src, re.DOTALL,
-            )
-            if not person_m:
-                person_m = re.search(
-                    r'"name":\s*"([^"]+)"[^}]{0,300}"@type":\s*"Person"',
-                    src, re.DOTALL,
-                )
+            person_m = _OP_PERSON_RE.search(src) or _OP_PERSON_REV_RE.search(src)
             if person_m:
                 author = person_m.group(1)
 
-            kw_m = re.search(r'"keywords":\s*"([^"]+)"', src)
+            kw_m = _OP_KEYWORDS_RE.search(src)
             countries = kw_m.group(1).split(", ")[:2] if kw_m else []
 
-            wc_m = re.search(r"~([\d,]+) words", src)
+            wc_m = _OP_WORDCOUNT_RE.search(src)
             wc = f"~{wc_m.group(1)} words" if wc_m else ""
 
             articles.append({
@@ -765,44 +1039,55 @@ def update_homepage_deep_dive() -> None:
 
 def main() -> None:
     print("=== Horn Updates Scraper ===")
+    existing = load_existing()
+    print(f"Loaded {len(existing)} existing articles")
     print(f"Fetching {len(FEEDS)} feeds …\n")
 
     incoming: List[Dict[str, Any]] = []
-    for feed_def in FEEDS:
-        try:
-            incoming.extend(fetch_feed(feed_def))
-        except Exception as e:
-            print(f"  [SKIP] {feed_def['source_name']}: {e}")
+    # Entries already published last run are skipped before tagging or AI context —
+    # except ones still without a context, so a failed/skipped OpenAI call is retried
+    seen_urls: set = {_url_key(a.get("source_url") or a.get("link")) for a in existing if a.get("context")}
+    seen_urls.discard("")
+    feed_cache = load_feed_cache()
+    fetched_validators: Dict[str, Dict[str, str]] = {}
+    # Downloads overlap in worker threads; parsing/tagging stays on this thread in FEEDS order.
+    try:
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+            downloads = [pool.submit(download_feed, feed_def, feed_cache) for feed_def in FEEDS]
+            for feed_def, download in zip(FEEDS, downloads):
+                try:
+                    incoming.extend(fetch_feed(feed_def, download, seen_urls))
+                except Exception as e:
+                    print(f"  [SKIP] {feed_def['source_name']}: {e}")
+                    continue  # keep the old validators so the feed is fetched in full next run
+                if download.exception() is None:
+                    _, validators = download.result()
+                    if validators:
+                        fetched_validators[feed_def["url"]] = validators
+    finally:
+        # Nothing after the fetch phase goes over this session; release its sockets
+        if _HTTP is not None:
+            _HTTP.close()
 
     print(f"\nFetched {len(incoming)} total new items")
 
-    existing = load_existing()
-    print(f"Loaded {len(existing)} existing articles")
-
-    merged = dedupe(existing, incoming)
-    final = apply_caps(merged)
-
-    # Only write (and update generated_at) when the articles list itself changed.
-    # Comparing canonical JSON avoids spurious commits caused by the timestamp alone.
-    final_json = json.dumps(final, indent=2, ensure_ascii=False)
-    existing_json: str = ""
-    if OUTPUT_PATH.exists():
-        try:
-            existing_data = json.loads(OUTPUT_PATH.read_text(encoding="utf-8"))
-            existing_articles = existing_data if isinstance(existing_data, list) else existing_data.get("articles", [])
-            existing_json = json.dumps(existing_articles, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"  [WARN] Could not read existing {OUTPUT_PATH.name} for comparison: {e} — will overwrite")
-
-    if final_json == existing_json:
-        print(f"\n✅ Articles unchanged — skipping write ({len(final)} articles)")
+    if not incoming:
+        # Last run's output is already deduped and capped — nothing to merge or rewrite
+        final = existing
+        print(f"\n✅ No new articles — skipping write ({len(final)} articles)")
     else:
-        payload = {
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "articles": final,
-        }
-        OUTPUT_PATH.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
-        print(f"\n✅ Wrote {len(final)} articles to {OUTPUT_PATH.name}")
+        merged = dedupe(existing, incoming)
+        fresh_ids = {id(a) for a in incoming}
+        final = apply_caps(
+            [a for a in merged if id(a) in fresh_ids],
+            [a for a in merged if id(a) not in fresh_ids],
+        )
+        add_contexts(final, incoming)
+        write_articles(final, existing)
+
+    # Only now that this run's articles are safely on disk, remember the validators
+    feed_cache.update(fetched_validators)
+    save_feed_cache(feed_cache)
 
     source_counts: Dict[str, int] = {}
     for a in final:
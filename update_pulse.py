@@ -3,17 +3,22 @@
 
 import os
 import re
+import argparse
 import json
 import asyncio
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # falls back to stdlib json
 
-BASE_DIR = Path(__file__).resolve().parent
+BASE_DIR = Path(__file__).parent  # __file__ is already absolute when run as a script
 OUTPUT_PATH = BASE_DIR / "ethio" / "ethio_articles.json"
-print("✅ EthioPulse OUTPUT_PATH:", OUTPUT_PATH)
-OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+LAST_IDS_PATH = OUTPUT_PATH.parent / "telegram_last_ids.json"  # channel -> newest saved message id
+USER_AGENT = "HornUpdatesBot/1.0 (+https://hornupdates.com)"  # same as update_articles.py
 
 
 
@@ -33,9 +38,17 @@ def strip_urls(s: str) -> str:
     s = re.sub(r"\s+", " ", s)     # collapse spaces
     return s.strip()
 
+def load_last_ids() -> Dict[str, int]:
+    try:
+        return json.loads(LAST_IDS_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
 def load_existing() -> Dict[str, Any]:
     if OUTPUT_PATH.exists():
         try:
+            if orjson:
+                return orjson.loads(OUTPUT_PATH.read_bytes())
             return json.loads(OUTPUT_PATH.read_text(encoding="utf-8"))
         except Exception:
             # If file is corrupted for any reason, start clean
@@ -47,28 +60,23 @@ def dedupe(existing: List[Dict[str, Any]], incoming: List[Dict[str, Any]]) -> Li
     """
     Deduplicate by (source, url, title). Keeps first occurrence order.
     """
-    seen = set()
-    merged: List[Dict[str, Any]] = []
-
+    # Insertion-ordered dict doubles as the seen-set; setdefault keeps the first item per key
+    merged: Dict[tuple, Dict[str, Any]] = {}
     for a in (existing or []) + (incoming or []):
-        key = (
-            a.get("source"),
-            a.get("source_url") or a.get("link"),
-            a.get("title"),
-        )
-        if key in seen:
-            continue
-        seen.add(key)
-        merged.append(a)
+        merged.setdefault((a.get("source"), a.get("source_url") or a.get("link"), a.get("title")), a)
 
-    return merged
+    return list(merged.values())
 
 
 # -----------------------------
 # SOURCE ADAPTERS (plug-in style)
 # -----------------------------
 
-def fetch_telegram() -> List[Dict[str, Any]]:
+def fetch_telegram(last_ids: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+    """
+    With last_ids, each channel only returns messages newer than its stored id (min_id),
+    and the entry is moved up to the newest message fetched (caller saves it).
+    """
     try:
         from telethon import TelegramClient
     except ImportError:
@@ -95,44 +103,59 @@ def fetch_telegram() -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
     client = TelegramClient("ethio_pulse_session", int(api_id), api_hash)
 
+    async def _fetch_channel(ch: str) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        out: List[Dict[str, Any]] = []
+        newest_id = None
+        entity = await client.get_entity(ch)
+        # Message ids are exact, unlike second-resolution dates: min_id returns only
+        # messages posted after the last one saved
+        async for msg in client.iter_messages(entity, limit=25, min_id=(last_ids or {}).get(ch, 0)):
+            newest_id = max(newest_id or 0, msg.id)
+            if not getattr(msg, "message", None):
+                continue
+
+            # Telethon's msg.date is typically timezone-aware; but we normalize to UTC ISO anyway.
+            published_at = now_utc_iso()
+            if getattr(msg, "date", None):
+                dt = msg.date
+                if dt.tzinfo is None:
+                    dt = dt.replace(tzinfo=timezone.utc)
+                published_at = dt.astimezone(timezone.utc).isoformat()
+
+            text = normalize_text(msg.message)
+            if not text:
+                continue
+
+            title = text[:90] + ("…" if len(text) > 90 else "")
+            link = f"https://t.me/{ch}/{msg.id}"
+
+            out.append(
+                {
+                    "title": title,
+                    "summary": text[:240] + ("…" if len(text) > 240 else ""),
+                    "source": f"Telegram: @{ch}",
+                    "source_url": link,
+                    "published_at": published_at,
+                    "category": "Pulse",
+                    "country": "Ethiopia",
+                    "source_type": "telegram",
+                }
+            )
+        return out, newest_id
+
     async def _run() -> None:
         await client.start()
-        for ch in channels:
-            try:
-                entity = await client.get_entity(ch)
-                async for msg in client.iter_messages(entity, limit=25):
-                    if not getattr(msg, "message", None):
-                        continue
-
-                    text = normalize_text(msg.message)
-                    if not text:
-                        continue
-
-                    title = text[:90] + ("…" if len(text) > 90 else "")
-                    link = f"https://t.me/{ch}/{msg.id}"
-
-                    # Telethon's msg.date is typically timezone-aware; but we normalize to UTC ISO anyway.
-                    published_at = now_utc_iso()
-                    if getattr(msg, "date", None):
-                        dt = msg.date
-                        if dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=timezone.utc)
-                        published_at = dt.astimezone(timezone.utc).isoformat()
-
-                    results.append(
-                        {
-                            "title": title,
-                            "summary": text[:240] + ("…" if len(text) > 240 else ""),
-                            "source": f"Telegram: @{ch}",
-                            "source_url": link,
-                            "published_at": published_at,
-                            "category": "Pulse",
-                            "country": "Ethiopia",
-                            "source_type": "telegram",
-                        }
-                    )
-            except Exception as e:
-                print(f"[WARN] Telegram channel {ch} failed: {e}")
+        # Channels are fetched concurrently over the one client connection;
+        # results are still appended in allowlist order.
+        fetched = await asyncio.gather(*(_fetch_channel(ch) for ch in channels), return_exceptions=True)
+        for ch, res in zip(channels, fetched):
+            if isinstance(res, Exception):
+                print(f"[WARN] Telegram channel {ch} failed: {res}")
+                continue
+            items, newest_id = res
+            if newest_id and last_ids is not None:
+                last_ids[ch] = newest_id
+            results.extend(items)
 
         await client.disconnect()
 
@@ -149,6 +172,10 @@ def fetch_rss_feeds() -> List[Dict[str, Any]]:
     except ImportError:
         print("[WARN] feedparser not installed. Run: pip install feedparser")
         return []
+    try:
+        import requests
+    except ImportError:
+        requests = None  # feedparser fetches the URL itself (no timeout)
 
     feeds = [
         # Add Ethiopia-focused RSS feeds here if available
@@ -156,8 +183,22 @@ def fetch_rss_feeds() -> List[Dict[str, Any]]:
     ]
 
     results: List[Dict[str, Any]] = []
+    session = None
+    if feeds and requests:
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
     for url in feeds:
-        d = feedparser.parse(url)
+        if session is not None:
+            # One keep-alive session with a bounded timeout, so a stalled feed can't hang the run
+            try:
+                r = session.get(url, timeout=(5, 10))
+                r.raise_for_status()
+            except requests.RequestException as e:
+                print(f"[WARN] RSS feed {url} failed: {e}")
+                continue
+            d = feedparser.parse(r.content)
+        else:
+            d = feedparser.parse(url)
         for e in getattr(d, "entries", [])[:25]:
             title = strip_urls(normalize_text(getattr(e, "title", "")))
             link = getattr(e, "link", None)
@@ -182,6 +223,8 @@ def fetch_rss_feeds() -> List[Dict[str, Any]]:
                 }
             )
 
+    if session is not None:
+        session.close()
     return results
 
 
@@ -193,14 +236,27 @@ def fetch_x() -> List[Dict[str, Any]]:
 
 
 def main() -> None:
-    existing_payload = load_existing()
-    existing = existing_payload.get("articles", [])
+    parser = argparse.ArgumentParser(description="Update the EthioPulse feed")
+    parser.add_argument("--verbose", action="store_true", help="Print the output path before fetching")
+    args = parser.parse_args()
+    if args.verbose:
+        print("✅ EthioPulse OUTPUT_PATH:", OUTPUT_PATH)
 
+    last_ids = load_last_ids()
     new_items: List[Dict[str, Any]] = []
-    new_items += fetch_telegram()
+    new_items += fetch_telegram(last_ids)
     new_items += fetch_rss_feeds()
     new_items += fetch_x()
 
+    if not new_items:
+        # Nothing fetched: the existing file is already deduped and cleaned, leave it as is
+        print(f"[OK] No new items fetched — {OUTPUT_PATH.name} left unchanged")
+        return
+
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    existing_payload = load_existing()
+    existing = existing_payload.get("articles", [])
+
     merged = dedupe(existing, new_items)
 
     BLOCK_SOURCES = {
@@ -222,11 +278,14 @@ def main() -> None:
         "articles": merged,
     }
 
-    OUTPUT_PATH.write_text(
-        json.dumps(payload, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
-
+    if orjson:
+        OUTPUT_PATH.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        # Written as bytes too, so both paths produce the same LF-only file on every
+        # platform (write_text would emit CRLF on Windows)
+        OUTPUT_PATH.write_bytes(json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8"))
+    # Only once the items are on disk, so a failed write refetches them next run
+    LAST_IDS_PATH.write_text(json.dumps(last_ids, indent=2), encoding="utf-8")
 
     print(f"[OK] Wrote {len(merged)} total items (new fetched this run: {len(new_items)})")
     print(f"[OK] Output → {OUTPUT_PATH}")
@@ -6,12 +6,22 @@ Uploads the local articles.json to your Hugging Face Space:
   repo_id = "KalidFan/HornUpdates"
 """
 
+import hashlib
+import importlib.util
+import os
 from pathlib import Path
+
+# Rust upload backend when installed; huggingface_hub reads this at import time
+# and errors out if it is set without the package.
+if importlib.util.find_spec("hf_transfer"):
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 from huggingface_hub import HfApi
 
 TOKEN_PATH = Path("hf_token.txt")
 SPACE_ID = "KalidFan/HornUpdates"
 LOCAL_JSON = Path("articles.json")
+UPLOADED_HASH = Path(".articles.uploaded.hash")  # digest of the last articles.json pushed
 
 
 def main():
@@ -28,16 +38,23 @@ def main():
         print(f"[ERROR] {LOCAL_JSON} not found. Run update_articles.py first.")
         return
 
+    data = LOCAL_JSON.read_bytes()  # read once: hashed here, uploaded as-is below
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if UPLOADED_HASH.exists() and UPLOADED_HASH.read_text(encoding="utf-8").strip() == digest:
+        print("[INFO] articles.json unchanged since last upload — skipping.")
+        return
+
     print("[INFO] Uploading articles.json to Hugging Face Space:", SPACE_ID)
     api = HfApi(token=token)
 
     api.upload_file(
-        path_or_fileobj=str(LOCAL_JSON),
+        path_or_fileobj=data,
         path_in_repo="articles.json",   # overwrite this file in the repo
         repo_id=SPACE_ID,
         repo_type="space",
     )
 
+    UPLOADED_HASH.write_text(digest, encoding="utf-8")
     print("[INFO] Upload complete.")
 
 